@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import subprocess
 import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 
 REQUIREMENTS_FILE = Path(__file__).resolve().parents[1] / "requirements.txt"
 
@@ -13,12 +15,11 @@ def _normalize_package_name(package: str) -> str:
     return package.replace("-", "_")
 
 
-def _iter_required_imports(requirements_path: Path) -> List[str]:
+@lru_cache(maxsize=1)
+def _parse_requirements(requirements_path: str, mtime_ns: int) -> Tuple[str, ...]:
+    # mtime_ns is only part of the cache key so edits to the file are picked up.
     imports: List[str] = []
-    if not requirements_path.exists():
-        return imports
-
-    for line in requirements_path.read_text(encoding="utf-8").splitlines():
+    for line in Path(requirements_path).read_text(encoding="utf-8").splitlines():
         stripped = line.strip()
         if not stripped or stripped.startswith("#"):
             continue
@@ -31,16 +32,38 @@ def _iter_required_imports(requirements_path: Path) -> List[str]:
                 pkg = pkg.split(token, 1)[0]
                 break
         imports.append(_normalize_package_name(pkg))
-    return imports
+    return tuple(imports)
+
+
+def _iter_required_imports(requirements_path: Path) -> List[str]:
+    if not requirements_path.exists():
+        return []
+    return list(_parse_requirements(str(requirements_path), requirements_path.stat().st_mtime_ns))
+
+
+def _is_module_available(module_name: str) -> bool:
+    # Anything already imported by this process is installed; no need to search for it.
+    if module_name in sys.modules:
+        return True
+
+    # find_spec locates the module without executing it, which keeps startup fast.
+    try:
+        return importlib.util.find_spec(module_name) is not None
+    except (ImportError, ValueError):
+        pass
+
+    try:
+        importlib.import_module(module_name)
+    except ImportError:
+        return False
+    return True
 
 
 def find_missing_packages(requirements_path: Path | None = None) -> List[str]:
     requirements_path = requirements_path or REQUIREMENTS_FILE
     missing: List[str] = []
     for module_name in _iter_required_imports(requirements_path):
-        try:
-            importlib.import_module(module_name)
-        except ImportError:
+        if not _is_module_available(module_name):
             missing.append(module_name)
     return missing
 
@@ -55,6 +78,8 @@ def install_requirements(requirements_path: Path | None = None) -> bool:
     print("Running:", " ".join(command))
     result = subprocess.run(command)
     if result.returncode == 0:
+        # Let find_spec see the freshly installed packages on the next check.
+        importlib.invalidate_caches()
         print("Dependencies installed successfully.")
         return True
 
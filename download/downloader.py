@@ -1,19 +1,26 @@
 from __future__ import annotations
 
+import argparse
 import logging
 import os
 import re
 import shutil
 import subprocess
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
+from diskcache import Cache
 from yt_dlp import YoutubeDL
 
+_LOG = logging.getLogger(__name__)
+
+FFMPEG_ENV_PATH = os.environ.get("FFMPEG_PATH", "")
 FFMPEG_CANDIDATES: Tuple[Path, ...] = (
-    Path(os.environ.get("FFMPEG_PATH", "")),
     Path("C:/ffmpeg/bin/ffmpeg.exe"),
     Path("C:/ffmpeg/ffmpeg.exe"),
 )
@@ -35,12 +42,36 @@ EXTRACTOR_ARGS: Dict[str, Any] = {
 RETRY_SLEEP_CONFIG: Dict[str, Any] = {"min": 1, "max": 5, "factor": 1.5}
 
 INVALID_PATH_CHARS = re.compile(r'[<>:"/\\|?*]')
+_SANITIZE_RE = re.compile(rf"{INVALID_PATH_CHARS.pattern}|\s+")
+
+CACHE_DIR = Path(__file__).resolve().parent / ".cache"
+METADATA_CACHE_TTL = 24 * 60 * 60
+
+metadata_cache = Cache(str(CACHE_DIR))
+
+PLAYLISTS_IO_BUFFER = 64 * 1024
+
+JOBS_ENV_VAR = "FTAWA_JOBS"
+DEFAULT_JOBS = 3
+CONVERSION_WORKERS = os.cpu_count() or 1
+FFMPEG_BATCH_SIZE = 8
+OVERVIEW_WORKERS = 8
+FFMPEG_GLOBAL_ARGS: Tuple[str, ...] = ("-y", "-nostdin", "-nostats", "-loglevel", "error")
+WAV_OUTPUT_ARGS: Tuple[str, ...] = ("-ar", "16000", "-ac", "1", "-threads", "1")
 
 
 class PlaylistDownloadError(RuntimeError):
     """Raised when a playlist fails to download."""
 
 
+class ConversionError(PlaylistDownloadError):
+    """Raised when ffmpeg fails; carries its stderr so the caller can decide how loudly to log it."""
+
+    def __init__(self, message: str, stderr: str = "") -> None:
+        super().__init__(message)
+        self.stderr = stderr
+
+
 @dataclass
 class PlaylistConfig:
     url: str
@@ -53,40 +84,117 @@ class PlaylistFile:
     configs: List[PlaylistConfig]
 
 
+@dataclass
+class PlaylistState:
+    """Per-playlist bookkeeping shared by the download and conversion workers."""
+
+    link_map: Dict[str, str]
+    audio_dir: Path
+    temp_dir: Path
+    ffmpeg_path: Path
+    jobs: int = DEFAULT_JOBS
+    successful_ids: set[str] = field(default_factory=set)
+    failed_details: Dict[str, Dict[str, str]] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+
 @dataclass(frozen=True)
 class PlaylistOption:
     config: PlaylistConfig
     display_title: str
     entry_count: int | None = None
+    # Overview fetched while listing playlists, handed to the downloader to skip a second lookup.
+    metadata: Dict[str, Any] | None = field(default=None, compare=False, repr=False)
+
+
+class YoutubeDLPool:
+    """Hands each worker thread its own YoutubeDL, reused for every video that thread downloads."""
+
+    def __init__(self, options: Dict[str, Any]) -> None:
+        self._options = options
+        self._local = threading.local()
+        self._instances: List[YoutubeDL] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> YoutubeDL:
+        ydl = getattr(self._local, "ydl", None)
+        if ydl is None:
+            ydl = YoutubeDL(self._options)  # type: ignore[arg-type]
+            self._local.ydl = ydl
+            with self._lock:
+                self._instances.append(ydl)
+        return ydl
+
+    def download(self, url: str) -> int:
+        ydl = self.get()
+        # download() returns a sticky error code that trouble() sets and never clears,
+        # so a reused instance would report every later video as failed without this reset.
+        ydl._download_retcode = 0
+        return ydl.download([url])
+
+    def close(self) -> None:
+        with self._lock:
+            instances, self._instances = self._instances, []
+        for ydl in instances:
+            ydl.close()
+
+    def __enter__(self) -> YoutubeDLPool:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
 
 def configure_logging() -> None:
+    if logging.getLogger().hasHandlers():
+        return
     logging.basicConfig(
         level=logging.INFO,
         format="%(asctime)s [%(levelname)s] %(message)s",
     )
 
 
+def resolve_job_count(explicit_jobs: int | None = None) -> int:
+    if explicit_jobs is not None:
+        return max(1, explicit_jobs)
+
+    env_value = os.environ.get(JOBS_ENV_VAR, "").strip()
+    if env_value:
+        try:
+            return max(1, int(env_value))
+        except ValueError:
+            _LOG.warning("Ignoring invalid %s value: %s", JOBS_ENV_VAR, env_value)
+    return DEFAULT_JOBS
+
+
+@lru_cache(maxsize=4)
 def resolve_ffmpeg_path(explicit_path: str | None = None) -> Path:
-    candidates: Iterable[Path]
+    candidates: Tuple[Path, ...]
     if explicit_path:
         candidates = (Path(explicit_path),)
     else:
-        candidates = filter(None, FFMPEG_CANDIDATES)
+        # FFMPEG_PATH wins, then whatever is on PATH, then the default Windows install locations.
+        lookups = (FFMPEG_ENV_PATH, shutil.which("ffmpeg"))
+        candidates = tuple(Path(lookup) for lookup in lookups if lookup) + FFMPEG_CANDIDATES
 
     for candidate in candidates:
-        if candidate and candidate.exists() and candidate.is_file():
+        if candidate.is_file():
             return candidate
 
     raise FileNotFoundError(
-        "Could not locate ffmpeg executable. Set FFMPEG_PATH env var or install at C:/ffmpeg/bin/ffmpeg.exe."
+        "Could not locate ffmpeg executable. Set FFMPEG_PATH env var, add ffmpeg to PATH "
+        "or install at C:/ffmpeg/bin/ffmpeg.exe."
     )
 
 
+def _sanitize_replacement(match: re.Match[str]) -> str:
+    return " " if match.group().isspace() else "_"
+
+
 def sanitize_name(name: str) -> str:
-    sanitized = INVALID_PATH_CHARS.sub("_", name)
+    # Invalid characters and whitespace runs are replaced in a single pass.
+    sanitized = _SANITIZE_RE.sub(_sanitize_replacement, name)
     sanitized = sanitized.strip().strip(".")
-    sanitized = re.sub(r"\s+", " ", sanitized)
     return sanitized or "playlist"
 
 
@@ -115,15 +223,16 @@ def load_playlist_configs(playlists_file: Path) -> PlaylistFile:
 
     comments: List[str] = []
     configs: List[PlaylistConfig] = []
-    for raw_line in playlists_file.read_text(encoding="utf-8").splitlines():
-        stripped = raw_line.strip()
-        if not stripped:
-            comments.append("")
-            continue
-        if stripped.startswith("#"):
-            comments.append(raw_line.rstrip())
-            continue
-        configs.append(parse_playlist_line(stripped))
+    with playlists_file.open("r", encoding="utf-8", buffering=PLAYLISTS_IO_BUFFER) as handle:
+        for raw_line in handle:
+            stripped = raw_line.strip()
+            if not stripped:
+                comments.append("")
+                continue
+            if stripped.startswith("#"):
+                comments.append(raw_line.rstrip())
+                continue
+            configs.append(parse_playlist_line(stripped))
 
     if not configs:
         raise ValueError(
@@ -133,34 +242,32 @@ def load_playlist_configs(playlists_file: Path) -> PlaylistFile:
     return PlaylistFile(comments=comments, configs=configs)
 
 
-def save_playlist_configs(playlists_file: Path, data: PlaylistFile) -> None:
-    lines: List[str] = []
+def iter_playlist_lines(data: PlaylistFile) -> Iterator[str]:
+    yield from data.comments
 
-    for comment in data.comments:
-        lines.append(comment)
-
-    if lines and lines[-1] != "":
-        lines.append("")
+    if data.comments and data.comments[-1] != "":
+        yield ""
 
     for config in data.configs:
         if config.name:
-            lines.append(f"{config.name}|{config.url}")
+            yield f"{config.name}|{config.url}"
         else:
-            lines.append(config.url)
+            yield config.url
+
 
-    content = "\n".join(lines) + "\n"
-    playlists_file.write_text(content, encoding="utf-8")
+def save_playlist_configs(playlists_file: Path, data: PlaylistFile) -> None:
+    with playlists_file.open("w", encoding="utf-8", buffering=PLAYLISTS_IO_BUFFER, newline="\n") as handle:
+        handle.writelines(f"{line}\n" for line in iter_playlist_lines(data))
 
 
 def ensure_playlist_structure(base_dir: Path) -> Dict[str, Path]:
     temp_dir = base_dir / "temp_webm"
     audio_dir = base_dir / "audio"
-    links_dir = base_dir / "vidLinks"
 
-    for directory in (temp_dir, audio_dir, links_dir):
+    for directory in (temp_dir, audio_dir):
         directory.mkdir(parents=True, exist_ok=True)
 
-    return {"temp": temp_dir, "audio": audio_dir, "links": links_dir}
+    return {"temp": temp_dir, "audio": audio_dir}
 
 
 def resolve_cookies_file() -> Path | None:
@@ -176,91 +283,317 @@ def resolve_cookies_file() -> Path | None:
     return None
 
 
-def extract_playlist_metadata(playlist_url: str) -> Dict[str, Any]:
-    params: Dict[str, Any] = {"quiet": True, "skip_download": True}
+def seed_download_archive(archive_path: Path, video_ids: Iterable[str]) -> None:
+    """Append yt-dlp archive lines for the given video IDs that are not recorded yet."""
+    known: set[str] = set()
+    if archive_path.exists():
+        with archive_path.open("r", encoding="utf-8") as handle:
+            known = {line.strip() for line in handle}
 
-    with YoutubeDL(params) as ydl:  # type: ignore[arg-type]
-        info = ydl.extract_info(playlist_url, download=False)
-    if not info:
-        raise PlaylistDownloadError(f"Failed to retrieve metadata for playlist: {playlist_url}")
-    if info.get("_type") == "url":
-        # Some playlists resolve to another URL (e.g., redirects). Extract again.
-        redirected_url = info.get("url")
-        if redirected_url:
-            return extract_playlist_metadata(redirected_url)
-    return info  # type: ignore[return-value]
+    new_lines = [f"youtube {video_id}" for video_id in sorted(video_ids)]
+    new_lines = [line for line in new_lines if line not in known]
+    if new_lines:
+        with archive_path.open("a", encoding="utf-8") as handle:
+            handle.writelines(f"{line}\n" for line in new_lines)
+
+
+def clear_metadata_cache() -> int:
+    return metadata_cache.clear()
+
+
+def _slim_playlist_info(info: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the fields the downloader reads so cached entries stay small and JSON-friendly."""
+    entries: List[Dict[str, Any]] = []
+    for entry in info.get("entries") or []:
+        if entry:
+            entries.append({"id": entry.get("id"), "webpage_url": entry.get("webpage_url") or entry.get("url")})
+
+    slim: Dict[str, Any] = {"id": info.get("id"), "title": info.get("title"), "entries": entries}
+    if isinstance(info.get("playlist_count"), int):
+        slim["playlist_count"] = info["playlist_count"]
+    return slim
 
 
-def extract_playlist_overview(playlist_url: str) -> Dict[str, Any]:
+def _fetch_playlist_overview(playlist_url: str) -> Dict[str, Any]:
     params: Dict[str, Any] = {
         "quiet": True,
         "skip_download": True,
-        "extract_flat": True,
+        # Only flatten the playlist entries; a top-level redirect is still resolved.
+        "extract_flat": "in_playlist",
     }
 
     with YoutubeDL(params) as ydl:  # type: ignore[arg-type]
         info = ydl.extract_info(playlist_url, download=False)
     if not info:
         raise PlaylistDownloadError(f"Failed to retrieve overview for playlist: {playlist_url}")
+    if info.get("_type") in {"url", "url_transparent"}:
+        # Some playlists resolve to another URL (e.g., redirects). Extract again.
+        redirected_url = info.get("url")
+        if redirected_url and redirected_url != playlist_url:
+            return _fetch_playlist_overview(redirected_url)
     return info  # type: ignore[return-value]
 
 
+def extract_playlist_overview(playlist_url: str, use_cache: bool = True) -> Dict[str, Any]:
+    key = ("overview", playlist_url)
+    if use_cache:
+        cached = metadata_cache.get(key)
+        if cached is not None:
+            return cached  # type: ignore[return-value]
+
+    info = _slim_playlist_info(_fetch_playlist_overview(playlist_url))
+    # An empty result may be a transient or unresolved lookup; don't pin it for the whole TTL.
+    if info["entries"]:
+        metadata_cache.set(key, info, expire=METADATA_CACHE_TTL)
+    return info
+
+
+def build_name_index(playlists: Sequence[PlaylistOption]) -> Dict[str, int]:
+    # Titles and configured names both resolve to their playlist; the first playlist listed wins on clashes.
+    by_name: Dict[str, int] = {}
+    for idx, option in enumerate(playlists, start=1):
+        by_name.setdefault(option.display_title.lower(), idx)
+        if option.config.name:
+            by_name.setdefault(option.config.name.lower(), idx)
+    return by_name
+
+
+def parse_selection(
+    choice: str,
+    playlists: Sequence[PlaylistOption],
+    by_name: Dict[str, int],
+) -> Tuple[List[PlaylistOption], List[str]]:
+    """Resolve a comma separated list of numbers or names into playlists, collecting every invalid part."""
+    choice = choice.strip() or "a"
+    if choice.lower() in {"a", "all"}:
+        return list(playlists), []
+
+    selected: List[PlaylistOption] = []
+    errors: List[str] = []
+    seen_indexes: set[int] = set()
+    for raw_part in choice.split(","):
+        part = raw_part.strip()
+        if not part:
+            continue
+
+        if part.isdigit():
+            idx = int(part)
+            if not 1 <= idx <= len(playlists):
+                errors.append(f"Invalid playlist number: {part}")
+                continue
+        else:
+            found = by_name.get(part.lower())
+            if found is None:
+                errors.append(f"Playlist name not recognised: {part}")
+                continue
+            idx = found
+
+        if idx not in seen_indexes:
+            seen_indexes.add(idx)
+            selected.append(playlists[idx - 1])
+
+    if not selected and not errors:
+        errors.append("No valid playlists selected.")
+    return selected, errors
+
+
 def prompt_for_playlist_selection(playlists: Sequence[PlaylistOption]) -> List[PlaylistOption]:
     if not playlists:
         return []
 
+    by_name = build_name_index(playlists)
+
+    print("Available playlists:")
+    for idx, option in enumerate(playlists, start=1):
+        label = option.display_title
+        if option.entry_count:
+            label = f"{label} ({option.entry_count} videos)"
+        print(f"  [{idx}] {label}")
+    print("  [A] All playlists")
+
     while True:
-        print("Available playlists:")
-        for idx, option in enumerate(playlists, start=1):
-            label = option.display_title
-            if option.entry_count:
-                label = f"{label} ({option.entry_count} videos)"
-            print(f"  [{idx}] {label}")
-        print("  [A] All playlists")
-
-        choice = input("\nEnter the playlist name or numbers (comma separated) to download [A]: ").strip()
-        if not choice:
-            choice = "a"
-
-        if choice.lower() in {"a", "all"}:
-            return list(playlists)
-
-        parts = [part.strip() for part in choice.split(",") if part.strip()]
-        selected: List[PlaylistOption] = []
-        seen_indexes: set[int] = set()
-        for part in parts:
-            if part.isdigit():
-                idx = int(part)
-                if 1 <= idx <= len(playlists) and idx not in seen_indexes:
-                    selected.append(playlists[idx - 1])
-                    seen_indexes.add(idx)
-                else:
-                    print("Invalid number in selection. Try again.\n")
-                    break
-            else:
-                lowered = part.lower()
-                match = next(
-                    (
-                        option
-                        for option in playlists
-                        if option.display_title.lower() == lowered
-                        or (option.config.name and option.config.name.lower() == lowered)
-                    ),
-                    None,
-                )
-                if match and match not in selected:
-                    selected.append(match)
-                else:
-                    print("Playlist name not recognised. Try again.\n")
-                    break
-        else:
-            if selected:
-                return selected
-            print("No valid playlists selected. Try again.\n")
+        choice = input("\nEnter the playlist name or numbers (comma separated) to download [A]: ")
+        selected, errors = parse_selection(choice, playlists, by_name)
+        if not errors:
+            return selected
+
+        for error in errors:
+            print(error)
+        print("Try again.")
+
+
+def record_failure(state: PlaylistState, video_id: str, reason: str, url: str | None = None) -> None:
+    if not video_id:
+        return
+    with state.lock:
+        existing = state.failed_details.get(video_id, {})
+        resolved_url = url or existing.get("url") or state.link_map.get(video_id, "")
+        state.failed_details[video_id] = {"url": resolved_url, "reason": reason}
+
+
+def mark_converted(state: PlaylistState, video_id: str) -> None:
+    with state.lock:
+        state.successful_ids.add(video_id)
+        state.failed_details.pop(video_id, None)
+
+
+def convert_source_file(state: PlaylistState, source_file: Path) -> None:
+    video_id = source_file.stem
+    output_file = state.audio_dir / f"{video_id}.wav"
+    try:
+        convert_to_wav(source_file, output_file, state.ffmpeg_path)
+        mark_converted(state, video_id)
+    except ConversionError as exc:
+        _LOG.error("ffmpeg failed for %s: %s", source_file, exc.stderr)
+        record_failure(state, video_id, f"conversion failed: {exc}")
+    except Exception as exc:  # noqa: BLE001
+        record_failure(state, video_id, f"conversion failed: {exc}")
+    finally:
+        source_file.unlink(missing_ok=True)
+
+
+def convert_source_batch(state: PlaylistState, batch: Sequence[Path]) -> None:
+    if len(batch) == 1:
+        convert_source_file(state, batch[0])
+        return
+
+    pairs = [(source_file, state.audio_dir / f"{source_file.stem}.wav") for source_file in batch]
+    try:
+        convert_batch_to_wav(pairs, state.ffmpeg_path)
+    except Exception as exc:  # noqa: BLE001
+        # One bad input aborts the whole ffmpeg run, so redo the batch file by file to isolate it.
+        # Only the files that fail again are logged as errors.
+        _LOG.warning("Batch conversion failed, converting %s files individually", len(batch))
+        if isinstance(exc, ConversionError):
+            _LOG.debug("ffmpeg output for the failed batch: %s", exc.stderr)
+        for source_file in batch:
+            convert_source_file(state, source_file)
+        return
+
+    for source_file in batch:
+        mark_converted(state, source_file.stem)
+        source_file.unlink(missing_ok=True)
+
+
+def convert_all_temp_files(state: PlaylistState) -> None:
+    # scandir entries already know their type, so no extra stat per file is needed.
+    with os.scandir(state.temp_dir) as scanner:
+        entries = [entry for entry in scanner if entry.is_file()]
+
+    sources: List[Path] = []
+    for entry in entries:
+        if entry.name.endswith(".part"):
+            video_id = entry.name.split(".")[0]
+            _LOG.warning("Skipping incomplete download %s", entry.name)
+            record_failure(state, video_id, "partial download detected (yt-dlp interruption)")
+            Path(entry.path).unlink(missing_ok=True)
             continue
+        sources.append(Path(entry.path))
 
-        # If we get here due to break in for-loop, restart prompt
-        continue
+    if not sources:
+        return
+
+    # Spread the files over one batch per worker, capped so a failed batch is cheap to redo.
+    batch_size = max(1, min(FFMPEG_BATCH_SIZE, -(-len(sources) // CONVERSION_WORKERS)))
+    batches = [sources[idx : idx + batch_size] for idx in range(0, len(sources), batch_size)]
+    # ffmpeg does the heavy lifting in its own process, so threads are enough to keep every core busy.
+    with ThreadPoolExecutor(max_workers=min(CONVERSION_WORKERS, len(batches))) as executor:
+        futures = [executor.submit(convert_source_batch, state, batch) for batch in batches]
+        for future in as_completed(futures):
+            future.result()
+
+
+def download_video(state: PlaylistState, pool: YoutubeDLPool, video_id: str) -> None:
+    url = state.link_map[video_id]
+    attempt = 0
+    while True:
+        attempt += 1
+        try:
+            return_code = pool.download(url)
+        except Exception as exc:  # noqa: BLE001
+            if attempt >= 3:
+                record_failure(state, video_id, f"download failed: {exc}", url=url)
+                return
+            wait = min(10, 2 * attempt)
+            _LOG.warning("Retrying download for %s due to error: %s. Retrying in %s seconds", video_id, exc, wait)
+            time.sleep(wait)
+            continue
+
+        if return_code == 0:
+            return
+
+        if attempt >= 3:
+            _LOG.error("yt-dlp returned non-zero exit code for %s after %s attempts", video_id, attempt)
+            return
+
+        wait = min(10, 2 * attempt)
+        _LOG.warning("yt-dlp returned code %s for %s, retrying in %s seconds", return_code, video_id, wait)
+        time.sleep(wait)
+
+
+def retry_video(state: PlaylistState, pool: YoutubeDLPool, video_id: str) -> None:
+    url = state.link_map[video_id]
+    _LOG.info("Retrying download for %s", video_id)
+    try:
+        pool.download(url)
+    except Exception as exc:  # noqa: BLE001
+        record_failure(state, video_id, f"individual retry failed: {exc}", url=url)
+        wait = min(10, 2)
+        time.sleep(wait)
+
+
+def download_all(
+    state: PlaylistState,
+    video_ids: Sequence[str],
+    worker: Callable[[PlaylistState, YoutubeDLPool, str], None],
+    options: Dict[str, Any],
+) -> None:
+    # The executor is shut down before the pool so no worker is mid-download when instances close.
+    with YoutubeDLPool(options) as pool, ThreadPoolExecutor(max_workers=max(1, state.jobs)) as executor:
+        futures = [executor.submit(worker, state, pool, video_id) for video_id in video_ids]
+        for future in as_completed(futures):
+            future.result()
+
+
+def load_known_links(index_file: Path, legacy_links_dir: Path) -> Dict[str, str]:
+    """Collect video links recorded by earlier runs, from links.tsv and the old per-video vidLinks/ files."""
+    known: Dict[str, str] = {}
+    if legacy_links_dir.is_dir():
+        for link_file in legacy_links_dir.glob("*.txt"):
+            link = link_file.read_text(encoding="utf-8").strip()
+            if link:
+                known[link_file.stem] = link
+
+    if index_file.exists():
+        with index_file.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                video_id, _, link = line.rstrip("\n").partition("\t")
+                if video_id and link:
+                    known[video_id] = link
+    return known
+
+
+def write_links_index(playlist_dir: Path, state: PlaylistState) -> None:
+    """Rewrite links.tsv with one 'video_id<TAB>url' line for every WAV in audio/."""
+    index_file = playlist_dir / "links.tsv"
+    legacy_links_dir = playlist_dir / "vidLinks"
+
+    # Earlier links are kept so videos since removed from the playlist don't lose their source URL.
+    links = load_known_links(index_file, legacy_links_dir)
+    for video_id in state.successful_ids:
+        if video_id in state.link_map:
+            links[video_id] = state.link_map[video_id]
+    audio_ids = {wav_file.stem for wav_file in state.audio_dir.glob("*.wav")}
+
+    lines = [f"{video_id}\t{links[video_id]}" for video_id in sorted(audio_ids) if video_id in links]
+    if lines:
+        index_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    elif index_file.exists():
+        index_file.unlink()
+
+    # The per-video files are folded into links.tsv above, so the old folder can go.
+    if legacy_links_dir.is_dir():
+        shutil.rmtree(legacy_links_dir, ignore_errors=True)
 
 
 def download_playlist_audio(
@@ -268,22 +601,24 @@ def download_playlist_audio(
     download_root: Path,
     ffmpeg_path: Path,
     metadata: Dict[str, Any] | None = None,
+    jobs: int = DEFAULT_JOBS,
+    use_cache: bool = True,
 ) -> None:
-    metadata = metadata or extract_playlist_metadata(playlist_url)
+    if not metadata or "entries" not in metadata:
+        metadata = extract_playlist_overview(playlist_url, use_cache=use_cache)
     playlist_title = friendly_title(metadata)
     playlist_dir_name = sanitize_name(playlist_title)
     playlist_dir = download_root / playlist_dir_name
-    logging.info("Processing playlist '%s' -> %s", playlist_title, playlist_dir)
+    _LOG.info("Processing playlist '%s' -> %s", playlist_title, playlist_dir)
 
     dirs = ensure_playlist_structure(playlist_dir)
     temp_dir = dirs["temp"]
     audio_dir = dirs["audio"]
-    links_dir = dirs["links"]
 
     raw_entries = metadata.get("entries") or []
     entries = [entry for entry in raw_entries if entry]
     if not entries:
-        logging.warning("No videos found in playlist: %s", playlist_url)
+        _LOG.warning("No videos found in playlist: %s", playlist_url)
         return
 
     # Build map of video id -> link for later persistence
@@ -294,54 +629,31 @@ def download_playlist_audio(
         if video_id and webpage_url:
             link_map[video_id] = webpage_url
 
-    successful_ids: set[str] = set()
-    failed_details: Dict[str, Dict[str, str]] = {}
-
-    def record_failure(video_id: str, reason: str, url: str | None = None) -> None:
-        if not video_id:
-            return
-        existing = failed_details.get(video_id, {})
-        resolved_url = url or existing.get("url") or link_map.get(video_id, "")
-        failed_details[video_id] = {"url": resolved_url, "reason": reason}
-
-    def convert_source_file(source_file: Path) -> None:
-        if source_file.is_dir():
-            return
-        if source_file.suffix == ".part":
-            video_id = source_file.name.split(".")[0]
-            logging.warning("Skipping incomplete download %s", source_file.name)
-            record_failure(video_id, "partial download detected (yt-dlp interruption)")
-            source_file.unlink(missing_ok=True)
-            return
-
-        video_id = source_file.stem
-        output_file = audio_dir / f"{video_id}.wav"
-        try:
-            convert_to_wav(source_file, output_file, ffmpeg_path)
-            successful_ids.add(video_id)
-            failed_details.pop(video_id, None)
-            link = link_map.get(video_id)
-            if link:
-                (links_dir / f"{video_id}.txt").write_text(link + "\n", encoding="utf-8")
-        except Exception as exc:  # noqa: BLE001
-            record_failure(video_id, f"conversion failed: {exc}")
-        finally:
-            source_file.unlink(missing_ok=True)
-
-    def convert_all_temp_files() -> None:
-        for candidate in list(temp_dir.glob("*")):
-            convert_source_file(candidate)
+    state = PlaylistState(
+        link_map=link_map,
+        audio_dir=audio_dir,
+        temp_dir=temp_dir,
+        ffmpeg_path=ffmpeg_path,
+        jobs=jobs,
+    )
 
     # Download best available audio into temp directory
     cookies_file = resolve_cookies_file()
     download_archive = playlist_dir / "downloaded_archive.txt"
 
+    # Videos converted on an earlier run are marked done and archived so yt-dlp skips them.
+    existing_ids = {wav_file.stem for wav_file in audio_dir.glob("*.wav")} & link_map.keys()
+    if existing_ids:
+        _LOG.info("Skipping %s videos that already have audio in %s", len(existing_ids), audio_dir)
+        state.successful_ids |= existing_ids
+        seed_download_archive(download_archive, existing_ids)
+
     ydl_opts: Dict[str, Any] = {
         "quiet": False,
         "format": "bestaudio/best",
         "outtmpl": str(temp_dir / "%(id)s.%(ext)s"),
         "ignoreerrors": True,
-        "noplaylist": False,
+        "noplaylist": True,
         "retries": 5,
         "fragment_retries": 5,
         "retry_sleep": RETRY_SLEEP_CONFIG,
@@ -353,174 +665,210 @@ def download_playlist_audio(
     }
 
     if cookies_file:
-        logging.info("Using cookies file %s", cookies_file)
+        _LOG.info("Using cookies file %s", cookies_file)
         ydl_opts["cookiefile"] = str(cookies_file)
 
-    logging.info("Downloading audio tracks to %s", temp_dir)
-    attempt = 0
-    while True:
-        attempt += 1
-        try:
-            with YoutubeDL(ydl_opts) as ydl:  # type: ignore[arg-type]
-                return_code = ydl.download([playlist_url])
-        except Exception as exc:  # noqa: BLE001
-            if attempt >= 3:
-                raise
-            wait = min(10, 2 * attempt)
-            logging.warning("Retrying playlist download due to error: %s. Retrying in %s seconds", exc, wait)
-            time.sleep(wait)
-            continue
-
-        if return_code == 0:
-            break
+    retry_opts: Dict[str, Any] = dict(ydl_opts)
+    retry_opts["ignoreerrors"] = False
+    retry_opts["force_overwrites"] = True
 
-        if attempt >= 3:
-            logging.error("yt-dlp returned non-zero exit code after %s attempts", attempt)
-            break
+    to_download = [video_id for video_id in link_map if video_id not in state.successful_ids]
+    _LOG.info("Downloading %s audio tracks to %s using %s workers", len(to_download), temp_dir, jobs)
+    download_all(state, to_download, download_video, ydl_opts)
+    # Conversion only starts once every worker is done so no in-flight download is touched.
+    convert_all_temp_files(state)
 
-        wait = min(10, 2 * attempt)
-        logging.warning("yt-dlp returned code %s, retrying in %s seconds", return_code, wait)
-        time.sleep(wait)
-
-    convert_all_temp_files()
-
-    pending_ids = [video_id for video_id in link_map if video_id not in successful_ids]
+    pending_ids = [video_id for video_id in link_map if video_id not in state.successful_ids]
     if pending_ids:
-        logging.warning(
+        _LOG.warning(
             "Detected %s videos without completed audio after first pass. Retrying individually.",
             len(pending_ids),
         )
-        retry_opts: Dict[str, Any] = dict(ydl_opts)
-        retry_opts["ignoreerrors"] = False
-        retry_opts["noplaylist"] = True
-        retry_opts["force_overwrites"] = True
-
-        for video_id in pending_ids:
-            url = link_map.get(video_id)
-            if not url:
-                record_failure(video_id, "missing URL in metadata")
-                continue
+        download_all(state, pending_ids, retry_video, retry_opts)
+        convert_all_temp_files(state)
 
-            logging.info("Retrying download for %s", video_id)
-            try:
-                with YoutubeDL(retry_opts) as ydl:  # type: ignore[arg-type]
-                    ydl.download([url])
-                convert_all_temp_files()
-            except Exception as exc:  # noqa: BLE001
-                record_failure(video_id, f"individual retry failed: {exc}", url=url)
-                wait = min(10, 2)
-                time.sleep(wait)
-
-    remaining_ids = [video_id for video_id in link_map if video_id not in successful_ids]
+    remaining_ids = [video_id for video_id in link_map if video_id not in state.successful_ids]
     for video_id in remaining_ids:
-        if video_id not in failed_details:
-            record_failure(video_id, "no audio file produced after retries")
+        if video_id not in state.failed_details:
+            record_failure(state, video_id, "no audio file produced after retries")
 
     total_videos = len(link_map)
-    logging.info("Finished processing playlist. Successful audio files: %s/%s", len(successful_ids), total_videos)
+    _LOG.info(
+        "Finished processing playlist. Successful audio files: %s/%s", len(state.successful_ids), total_videos
+    )
+
+    write_links_index(playlist_dir, state)
 
     failed_report = playlist_dir / "failed_downloads.txt"
-    if failed_details:
+    if state.failed_details:
         lines = [
             "The following videos failed to download or convert:",
             "",
             "Video ID | URL | Reason",
             "---------------------------------------------",
         ]
-        for video_id, detail in sorted(failed_details.items()):
+        for video_id, detail in sorted(state.failed_details.items()):
             lines.append(f"{video_id} | {detail.get('url', '')} | {detail.get('reason', 'unknown')}")
         lines.append("")
         lines.append(
             "Retry the downloader once the throttling subsides. Videos listed here will be attempted again on the next run."
         )
         failed_report.write_text("\n".join(lines) + "\n", encoding="utf-8")
-        logging.warning("Some videos failed to process. See %s for details.", failed_report)
+        _LOG.warning("Some videos failed to process. See %s for details.", failed_report)
     elif failed_report.exists():
         failed_report.unlink()
 
     # Clean up temporary downloads
-    logging.info("Cleaning up temporary directory %s", temp_dir)
+    _LOG.info("Cleaning up temporary directory %s", temp_dir)
     shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def convert_to_wav(source: Path, destination: Path, ffmpeg_path: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    command = [
-        str(ffmpeg_path),
-        "-y",
-        "-i",
-        str(source),
-        "-ar",
-        "16000",
-        "-ac",
-        "1",
-        str(destination),
-    ]
-
-    logging.info("Converting %s -> %s", source.name, destination.name)
-    result = subprocess.run(command, capture_output=True, text=True)
-    if result.returncode != 0:
-        logging.error("ffmpeg failed for %s: %s", source, result.stderr)
-        raise PlaylistDownloadError(f"ffmpeg conversion failed for {source}")
-
-
-def run(playlists_path: Path | None = None, download_root: Path | None = None, ffmpeg_override: str | None = None) -> None:
+    convert_batch_to_wav([(source, destination)], ffmpeg_path)
+
+
+def convert_batch_to_wav(pairs: Sequence[Tuple[Path, Path]], ffmpeg_path: Path) -> None:
+    """Convert every (source, destination) pair with a single ffmpeg process."""
+    # ffmpeg writes to temporary names that are only renamed on success: an existing .wav in
+    # audio/ marks the video as done, so a truncated output must never be left behind.
+    partial_files = [destination.with_name(f"{destination.name}.tmp") for _, destination in pairs]
+
+    command = [str(ffmpeg_path), *FFMPEG_GLOBAL_ARGS]
+    for source, _ in pairs:
+        command.extend(["-i", str(source)])
+    for index, ((_, destination), partial_file) in enumerate(zip(pairs, partial_files)):
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        if len(pairs) > 1:
+            command.extend(["-map", f"{index}:a:0"])
+        command.extend([*WAV_OUTPUT_ARGS, "-f", "wav", str(partial_file)])
+
+    if _LOG.isEnabledFor(logging.INFO):
+        for source, destination in pairs:
+            _LOG.info("Converting %s -> %s", source.name, destination.name)
+    # stderr is kept as bytes and only decoded when ffmpeg actually fails.
+    try:
+        result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if result.returncode != 0:
+            sources = ", ".join(str(source) for source, _ in pairs)
+            stderr = result.stderr.decode("utf-8", errors="replace")
+            raise ConversionError(f"ffmpeg conversion failed for {sources}", stderr=stderr)
+
+        for (_, destination), partial_file in zip(pairs, partial_files):
+            os.replace(partial_file, destination)
+    finally:
+        for partial_file in partial_files:
+            partial_file.unlink(missing_ok=True)
+
+
+def run(
+    playlists_path: Path | None = None,
+    download_root: Path | None = None,
+    ffmpeg_override: str | None = None,
+    jobs: int | None = None,
+    use_cache: bool = True,
+) -> None:
     configure_logging()
 
     playlists_path = playlists_path or Path(__file__).with_name("playlists")
     download_root = download_root or Path(__file__).parent
     ffmpeg_path = resolve_ffmpeg_path(ffmpeg_override)
 
-    logging.info("Using ffmpeg at %s", ffmpeg_path)
+    jobs = resolve_job_count(jobs)
+
+    _LOG.info("Using ffmpeg at %s", ffmpeg_path)
 
     playlist_file = load_playlist_configs(playlists_path)
 
+    # Overviews for unnamed playlists are independent network round-trips, so fetch them all at once.
+    urls_to_fetch = list(dict.fromkeys(config.url for config in playlist_file.configs if config.name is None))
+    overviews: Dict[str, Dict[str, Any]] = {}
+    if urls_to_fetch:
+        with ThreadPoolExecutor(max_workers=min(OVERVIEW_WORKERS, len(urls_to_fetch))) as executor:
+            futures = {executor.submit(extract_playlist_overview, url, use_cache): url for url in urls_to_fetch}
+            for future in as_completed(futures):
+                url = futures[future]
+                try:
+                    overviews[url] = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    _LOG.warning(
+                        "Unable to fetch playlist title for %s, using URL instead: %s",
+                        url,
+                        exc,
+                    )
+
     options: List[PlaylistOption] = []
     updated = False
     for config in playlist_file.configs:
         display_title = config.name or config.url
         entry_count: int | None = None
 
-        if config.name is None:
-            try:
-                overview = extract_playlist_overview(config.url)
-                display_title = overview.get("title") or display_title
-                entries = overview.get("entries")
-                if isinstance(entries, list):
-                    entry_count = len([entry for entry in entries if entry])
-                elif isinstance(overview.get("playlist_count"), int):
-                    entry_count = int(overview["playlist_count"])
-                config.name = display_title
-                updated = True
-            except Exception as exc:  # noqa: BLE001
-                logging.warning(
-                    "Unable to fetch playlist title for %s, using URL instead: %s",
-                    config.url,
-                    exc,
-                )
-
-        options.append(PlaylistOption(config=config, display_title=display_title, entry_count=entry_count))
+        overview = overviews.get(config.url) if config.name is None else None
+        if overview is not None:
+            display_title = overview.get("title") or display_title
+            entries = overview.get("entries")
+            if isinstance(entries, list):
+                entry_count = len([entry for entry in entries if entry])
+            elif isinstance(overview.get("playlist_count"), int):
+                entry_count = int(overview["playlist_count"])
+            config.name = display_title
+            updated = True
+
+        options.append(
+            PlaylistOption(
+                config=config,
+                display_title=display_title,
+                entry_count=entry_count,
+                metadata=overview,
+            )
+        )
 
     if updated:
         save_playlist_configs(playlists_path, playlist_file)
 
     if not options:
-        logging.error("No valid playlists available to download.")
+        _LOG.error("No valid playlists available to download.")
         return
 
     selections = prompt_for_playlist_selection(options)
     if not selections:
-        logging.info("No playlists selected. Nothing to download.")
+        _LOG.info("No playlists selected. Nothing to download.")
         return
 
+    # Playlists run one after another so `jobs` caps the total number of concurrent video downloads.
     for option in selections:
         config = option.config
-        logging.info("Selected playlist: %s", option.display_title)
+        _LOG.info("Selected playlist: %s", option.display_title)
         try:
-            download_playlist_audio(config.url, download_root, ffmpeg_path, metadata=None)
+            download_playlist_audio(
+                config.url,
+                download_root,
+                ffmpeg_path,
+                metadata=option.metadata,
+                jobs=jobs,
+                use_cache=use_cache,
+            )
         except Exception as exc:  # noqa: BLE001
-            logging.error("Failed to process playlist %s: %s", config.url, exc)
+            _LOG.error("Failed to process playlist %s: %s", config.url, exc)
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Download YouTube playlists as Whisper-ready WAV files.")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help=f"Number of videos to download concurrently (default: ${JOBS_ENV_VAR} or {DEFAULT_JOBS}).",
+    )
+    parser.add_argument(
+        "--no-cache",
+        dest="use_cache",
+        action="store_false",
+        help="Ignore cached playlist metadata and fetch it from YouTube again.",
+    )
+    return parser.parse_args(argv)
 
 
 if __name__ == "__main__":
-    run()
+    args = parse_args()
+    run(jobs=args.jobs, use_cache=args.use_cache)
@@ -12,6 +12,13 @@ def run_downloads() -> None:
     execute_downloads()
 
 
+def clear_download_cache() -> None:
+    from download.downloader import clear_metadata_cache
+
+    removed = clear_metadata_cache()
+    print(f"Cleared {removed} cached playlist entries.")
+
+
 def clear_console() -> None:
     print("\033[2J\033[H", end="")
 
@@ -24,6 +31,7 @@ def menu() -> None:
     options = {
         "1": ("Download YouTube playlists", run_downloads, True),
         "2": ("Install project dependencies", ensure_dependencies, False),
+        "3": ("Clear cached playlist metadata", clear_download_cache, True),
         "q": ("Quit", None, False),
     }
 